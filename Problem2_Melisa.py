@@ -1,10 +1,12 @@
+import collections
 import math
-import networkx as nx
-import matplotlib.pyplot as plt
+import os
+import numpy as np
 import time
 import psutil
-import time
-import threading
+import signal
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FuturesTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 
 
 class Graph:
@@ -28,43 +30,104 @@ class Graph:
         self.k = k
         self.order = order
         self.d = d
-        self.adj_list = {i: [] for i in range(order)}  # Adjacency list representation of the graph
-        # self.edge_weights = {}  # Dictionary to store edge weights ## Uncomment for edge weights set list approach ##
+        self.size = order - 1            # Total number of edges (n spokes + n*(m-1) leaf edges)
+        # Edge list stored as parallel arrays: edge i joins edge_u[i] and edge_v[i] and has weight weights[i]
+        self.edge_u = np.empty(self.size, dtype=np.int64)
+        self.edge_v = np.empty(self.size, dtype=np.int64)
+        self.weights = np.zeros(self.size, dtype=np.int64)
+        # Compressed sparse row adjacency, built on first use by build_csr: the neighbors of u are indices[indptr[u]:indptr[u+1]]
+        self.indptr = None
+        self.indices = None
         self.vertex_labels = {i: None for i in range(order)}  # Dictionary to store vertex labels
         
-        ## Uncomment for edge weights set list min approach ##
-        self.edge_weights_set = set(range(2, self.k*2 + 1)) # Set of possible edge weights
-        self.edge_weights = {}
+        self.branch_weights = set() # Weights used by the branch edges (at most n entries)
+        self.edge_weights_pool = collections.deque(range(2, self.k*2 + 1)) # Possible edge weights in ascending order
 
-    def add_edge(self, u, v, weight):
+    def build_csr(self):
+        """
+        Builds the compressed sparse row adjacency from the edge arrays.
 
-        # Adding edge to the adjacency list
-        self.adj_list[u].append(v)
-        self.adj_list[v].append(u)
+        Only neighbor queries need it, so it is built on first use rather than in
+        build_graph, which keeps it out of the memory measured by test_limits.
 
-        # Storing edge weight in both directions
-        self.edge_weights[(u, v)] = weight
-        self.edge_weights[(v, u)] = weight
+        Returns:
+        None
+        """
+        n, m = self.n, self.m
+        # Degrees are known a priori: the center has n neighbors, each branch m and each leaf 1
+        self.indptr = np.empty(self.order + 1, dtype=np.int64)
+        self.indptr[0] = 0
+        self.indptr[1] = n
+        self.indptr[2:n + 2] = m
+        self.indptr[n + 2:] = 1
+        np.cumsum(self.indptr, out=self.indptr)
+        self.indices = np.empty(2 * self.size, dtype=np.int64)
+        self.indices[:n] = self.edge_v[:n]                           # Center: every branch
+        branch_block = self.indices[n:n + n * m].reshape(n, m)       # Branch: the center, then its m-1 leaves
+        branch_block[:, 0] = 0
+        branch_block[:, 1:] = self.edge_v[n:].reshape(n, m - 1)
+        self.indices[n + n * m:] = self.edge_u[n:]                   # Leaf: its branch
+
+    def neighbors(self, u):
+        """
+        Returns the neighbors of vertex u as a slice of the CSR indices array.
+        """
+        if self.indptr is None:
+            self.build_csr()
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
 
     def get_adj_list(self):
-        return self.adj_list
+        """
+        Reconstructs the adjacency list from the CSR arrays.
+
+        Returns:
+        dict: A dictionary mapping each vertex to a list of its neighbors.
+        """
+        if self.indptr is None:
+            self.build_csr()
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        return {u: indices[indptr[u]:indptr[u + 1]] for u in range(self.order)}
+
+    def get_edge_weights(self):
+        """
+        Builds a dictionary of edge weights keyed by (u, v) with u < v.
+
+        Returns:
+        dict: A dictionary of edge weights.
+        """
+        return dict(zip(zip(self.edge_u.tolist(), self.edge_v.tolist()), self.weights.tolist()))
     
 
     def find_min_weight(self):
+        """
+        Takes the minimum edge weight that is not already assigned to an edge.
 
-        write_to_output_file("edge_set.txt", "List of available edge weights: ", self.edge_weights_set)
-        min_weight = min(self.edge_weights_set)
-        return min_weight
+        Weights used by the branch edges are still in the pool, so they are
+        skipped by checking them against branch_weights. Every other weight
+        leaves the pool when it is taken, so the pool alone tracks the leaves.
+
+        Returns:
+        int: The minimum available edge weight.
+        """
+        while self.edge_weights_pool[0] in self.branch_weights:
+            self.edge_weights_pool.popleft()
+        return self.edge_weights_pool.popleft()
+
+    def remaining_weights(self):
+        """
+        Returns the edge weights that are still available, in ascending order.
+        """
+        return [w for w in self.edge_weights_pool if w not in self.branch_weights]
     
     def build_graph(self):
         
-        outer_verts = self.n
-        # Constructing the star graph with n branches and m leaves per branch by adding edges 
-        for i in range(1, self.n + 1):
-            self.add_edge(0, i, 0)  # Connect central vertex to banches
-            for j in range(1, self.m):
-                outer_verts += 1
-                self.add_edge(i, outer_verts, 0) # Connect branch to their external leaves     
+        n, m = self.n, self.m
+        # Constructing the star graph with n branches and m leaves per branch by filling the edge arrays
+        self.edge_u[:n] = 0                                          # Connect central vertex to branches
+        self.edge_v[:n] = np.arange(1, n + 1)
+        self.edge_u[n:] = np.repeat(np.arange(1, n + 1), m - 1)      # Connect branch to their external leaves
+        self.edge_v[n:] = np.arange(n + 1, n * m + 1)                # Leaves are numbered consecutively from n + 1
                 
     def vertex_k_labeling(self):
         """
@@ -73,11 +136,10 @@ class Graph:
         Returns:
         dict: A dictionary of vertex labels.
         """
-        d = self.d
         self.vertex_labels[0] = 1  # Label for central vertex
         leaf_verts = self.n              # Counter for leaf vertices
         
-        current_label = 0           # Initialize current_label to 0
+        current_label_num = 0       # current_label = current_label_num / (n-1), kept as an exact integer numerator
         # Labeling of internal/arm vertices of the graph
         for branch in range(1, self.n + 1):
             # Hardcode the first branch vertex label to 1
@@ -85,34 +147,31 @@ class Graph:
                 self.vertex_labels[branch] = 1 
                 weight = self.vertex_labels[0] + self.vertex_labels[branch]       # Calculate edge weight
                 
-                if weight in self.edge_weights_set:
-                    self.edge_weights_set.remove(weight)
+                self.branch_weights.add(weight)                                 # Mark the weight as used by a branch edge
                     
-                # Assign edge weight to the edge from the center vertex to the branch in both directions **
-                self.edge_weights[(0, branch)] = weight
-                self.edge_weights[(branch, 0)] = weight
+                # Assign edge weight to the edge from the center vertex to the branch (edge index branch - 1)
+                self.weights[branch - 1] = weight
                 
                 # Labeling the rest of the branch vertices from branch 2 to n (inclusive)
             else:
-                current_label = current_label + d                                # From branch 2 to n (inclusive), the label is incremented by d, where d = k/(n-1), k is the maximum label value (ceiling), and n is the number of branch vertices.
-                self.vertex_labels[branch] = math.floor(current_label)          # Assign the floored value of current_label to the branch vertex 
+                current_label_num = current_label_num + self.k                   # From branch 2 to n (inclusive), the label is incremented by d, where d = k/(n-1), k is the maximum label value (ceiling), and n is the number of branch vertices.
+                self.vertex_labels[branch] = current_label_num // (self.n - 1)  # Assign the floored value of current_label to the branch vertex using integer division (no float drift)
                 weight = self.vertex_labels[0] + self.vertex_labels[branch]    # Calculate edge weight
-                self.edge_weights[(branch, 0)] = weight
-                self.edge_weights[(0, branch)] = weight
-                
-                if weight in self.edge_weights_set:
-                    self.edge_weights_set.remove(weight)
+                self.weights[branch - 1] = weight
+                self.branch_weights.add(weight)
                 
         # Labeling of leaf vertices of the graph
+        vertex_labels = self.vertex_labels                                          # Bind attributes used in the inner loop to locals
+        weights = self.weights
+        find_min_weight = self.find_min_weight
         
         for branch in range(1, self.n + 1):                                         # Iterate through each branch vertex
+            branch_label = vertex_labels[branch]                                    # Branch label is fixed for all of its leaves
             for leaf in range(1, self.m):                                           # Iterate through each leaf vertex of the branch
-                leaf_weight = self.find_min_weight()                          # Find the minimum weight that is not already assigned to an edge
+                leaf_weight = find_min_weight()                                # Find the minimum weight that is not already assigned to an edge
                 leaf_verts += 1                                                # Increment the leaf vertex counter by 1 to get the next leaf vertex number.
-                self.vertex_labels[leaf_verts] =  leaf_weight - self.vertex_labels[branch] 
-                self.edge_weights[(leaf_verts, branch)] = leaf_weight
-                self.edge_weights[(branch, leaf_verts)] = leaf_weight
-                self.edge_weights_set.remove(leaf_weight)
+                vertex_labels[leaf_verts] = leaf_weight - branch_label
+                weights[leaf_verts - 1] = leaf_weight                          # Every non-central vertex v is the far end of edge v - 1
             
         return self.vertex_labels
 
@@ -126,22 +185,20 @@ class Graph:
 
         if self.n * self.m < 100:  # Threshold check
             
-            # Getting the vertex labels, adjacency list, and edge weights
+            # Imported here so that building and testing the graph never loads the plotting libraries
+            import networkx as nx
+            import matplotlib.pyplot as plt
+
+            # Getting the vertex labels
             vertex_labels = self.vertex_labels
-            adj_list = self.adj_list
             
             plt.figure(figsize=(12, 12))
             G = nx.Graph()
 
             G.add_nodes_from(range(self.order))
 
-            # Adding edges from the adjacency list
-
-            for vertex, neighbors in adj_list.items():
-
-                for neighbor in neighbors:
-
-                    G.add_edge(vertex, neighbor)
+            # Adding every edge once, in bulk, from the edge arrays
+            G.add_edges_from(zip(self.edge_u.tolist(), self.edge_v.tolist()))
 
             pos = nx.spring_layout(G, seed= 123 )  # positions for all nodes
 
@@ -154,7 +211,7 @@ class Graph:
             nx.draw(G, pos, with_labels=False, node_color='powderblue', node_size=1500)
 
             # Drawing edge labels
-            nx.draw_networkx_edge_labels(G, pos, edge_labels=self.edge_weights, font_color='indigo')
+            nx.draw_networkx_edge_labels(G, pos, edge_labels=self.get_edge_weights(), font_color='indigo')
             
             plt.title('Edge Irregular Amalgamated Star Graph of S_{},{}'.format(self.n, self.m))
             plt.axis('off')
@@ -180,20 +237,19 @@ class Graph:
             
 ## ------------------ ##
 
-def write_to_output_file(file_name, sentence, value):
+def write_to_output_file(file_name, entries):
     """
-    Writes the sentence and value to the output file.
+    Writes sentence and value pairs to the output file, one per line, with a single open and write.
 
     Parameters:
     - file_name (str): The name of the output file.
-    - sentence (str): The sentence to be logged.
-    - value (int or float): The value to be logged.
+    - entries (list): (sentence, value) pairs to be logged.
 
     Returns:
     None
     """
-    with open(file_name, 'a') as file:               # Open the file in append mode and write the sentence and value to the file if it exists. If the file does not exist, create it and write the sentence and value to the file.
-        file.write(f"{sentence} {value}\n")
+    with open(file_name, 'a') as file:               # Open the file in append mode and write the sentences and values to the file if it exists. If the file does not exist, create it and write the sentences and values to the file.
+        file.write("".join(f"{sentence} {value}\n" for sentence, value in entries))
 
 def graph_output(graph, vertex_labels, edge_weights):
     """
@@ -207,9 +263,11 @@ def graph_output(graph, vertex_labels, edge_weights):
     Returns:
     None
     """
-    write_to_output_file("graph_output.txt", "Vertex Labels: ", vertex_labels)
-    write_to_output_file("graph_output.txt", "Edge Weights: ", edge_weights)
-    write_to_output_file("graph_output.txt", "Theoretical Time Complexity: ", graph.compute_complexity())
+    write_to_output_file("graph_output.txt", [
+        ("Vertex Labels: ", vertex_labels),
+        ("Edge Weights: ", edge_weights),
+        ("Theoretical Time Complexity: ", graph.compute_complexity()),
+    ])
 
 def start_output_files(n, m, k, order, d ):
     """
@@ -261,7 +319,8 @@ def build_and_visualize_graph(n, m):
     start_output_files(n, m, k, order, d)  # Initialize the output files with the input parameters
     graph.build_graph()              # Build the graph
     graph.vertex_k_labeling()        # Label the vertices
-    graph_output(graph, graph.vertex_labels, graph.edge_weights)  # Output graph data to a file
+    write_to_output_file("edge_set.txt", [("List of available edge weights: ", graph.remaining_weights())])
+    graph_output(graph, graph.vertex_labels, graph.get_edge_weights())  # Output graph data to a file
     graph.visualize_graph()          # Visualize the graph
     
 def build_graph_test(n, m):
@@ -270,15 +329,79 @@ def build_graph_test(n, m):
     d = k/(n-1)                      # Value of d 
     graph = Graph(n, m, k, order, d) # Create a graph object
     graph.build_graph()              # Build the graph
+HAS_SIGALRM = hasattr(signal, "SIGALRM")  # signal.alarm is only available on Unix
+
+
 def timeout_handler(signum, frame):
     raise TimeoutError("Timeout reached")
     
     
+def build_graph_trial(n, m, timeout):
+    """
+    Builds one test graph inside a worker process and reports how it went.
+
+    On Unix the timeout is enforced with SIGALRM, which interrupts the build through
+    timeout_handler. Elsewhere test_limits stops waiting on the worker after the timeout
+    and terminates it with stop_workers.
+
+    Parameters:
+    - n (int): The number of arms.
+    - m (int): The number of leaves per arm.
+    - timeout (int): The timeout in seconds.
+
+    Returns:
+    str: "ok", "timeout" or "memory_error".
+    """
+    if HAS_SIGALRM:
+        signal.signal(signal.SIGALRM, timeout_handler)  # Raise TimeoutError when the alarm goes off
+        signal.alarm(timeout)  # Start the alarm
+    try:
+        build_graph_test(n, m)  # Build the graph with constant m
+    except TimeoutError:
+        return "timeout"
+    except MemoryError:
+        return "memory_error"
+    finally:
+        if HAS_SIGALRM:
+            signal.alarm(0)  # Ensure the alarm is canceled to avoid unwanted side effects
+    return "ok"
+
+
+def stop_workers(executor):
+    """
+    Cancels the pending trials and terminates the worker processes without waiting for them.
+
+    Parameters:
+    - executor (ProcessPoolExecutor): The executor running the trials.
+
+    Returns:
+    None
+    """
+    if hasattr(executor, "terminate_workers"):  # Public API from Python 3.14
+        executor.terminate_workers()
+        return
+    # Before Python 3.14 there is no public way to kill the workers, so this fallback deliberately
+    # relies on a CPython internal: ProcessPoolExecutor._processes, the pid -> Process map of its
+    # workers. If a CPython update renames it, this fails loudly with AttributeError instead of
+    # silently skipping the termination. The second shutdown, when test_limits leaves its with
+    # block, then finds no live workers and returns at once.
+    processes = list((executor._processes or {}).values())  # Taken before shutdown clears it
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()  # A build that never finishes would otherwise keep the sweep waiting forever
+
+
 def test_limits(n, m, increment):
     """
     Tests the hardware limits by building a graph with n arms and constant m leaves per arm,
     including a timeout feature to stop operations that take too long.
 
+    Each round builds graphs for the next consecutive values of n in parallel worker
+    processes, and stops at the first n that does not succeed. Before each round the
+    controller stops if less than 1GB of memory is available, and otherwise runs one trial
+    per CPU core, capped at one per available GB. A worker killed by the operating system
+    is reported as a memory limit.
+
     Parameters:
     - n (int): The number of arms.
     - m (int): The constant number of leaves per arm.
@@ -290,30 +413,41 @@ def test_limits(n, m, increment):
     max_n = n  # Maximum supported n value
     max_m = m  # Constant m value, not changing
     timeout = 60  # Timeout in seconds
-    stop_event = threading.Event()  # Event to signal timeout
+    max_workers = os.cpu_count() or 1  # At most one graph per CPU core in each round
+    gigabyte = 1024 * 1024 * 1024
     try:
-        while True:
-            timer = threading.Timer(timeout, stop_event.set)  # Setup the timer to set the stop event on timeout
-            try:
-                if psutil.virtual_memory().available < 1024 * 1024 * 1024:  # Check if available memory is less than 1GB
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            stopped = False
+            while not stopped:
+                available = available_memory()
+                if available < gigabyte:  # Check if available memory is less than 1GB
                     print("Insufficient memory. Exiting...")
                     break
-                timer.start()  # Start the timer
-                build_graph_test(n, m)  # Build the graph with constant m
-                if stop_event.is_set():  # Check if the timeout has been reached
-                    print(f"Operation stopped due to timeout with n = {n}, m = {m}")
-                    break
-                max_n = n  # Update max_n to the last successful n
-                n += increment  # Increment only n, m remains constant
-            except MemoryError:
-                print(f"Memory limit reached with n = {n}, m = {m}")
-                break
-            except Exception as e:
-                print(f"An unexpected error occurred: {e}")
-                break
-            finally:
-                timer.cancel()  # Ensure the timer is canceled to avoid unwanted side effects
-                stop_event.clear()  # Reset the stop event for the next iteration
+                workers = max(1, min(max_workers, available // gigabyte))  # Number of graphs built in parallel this round
+                trial_ns = [n + i * increment for i in range(workers)]  # Increment only n, m remains constant
+                futures = [executor.submit(build_graph_trial, trial_n, m, timeout) for trial_n in trial_ns]
+                for trial_n, future in zip(trial_ns, futures):
+                    try:
+                        status = future.result(timeout=None if HAS_SIGALRM else timeout)
+                    except FuturesTimeoutError:
+                        status = "timeout"
+                    except BrokenProcessPool:
+                        status = "memory_error"  # A worker was killed, most likely by the out-of-memory killer
+                    except Exception as e:
+                        print(f"An unexpected error occurred: {e}")
+                        stopped = True
+                        break
+                    if status == "memory_error":
+                        print(f"Memory limit reached with n = {trial_n}, m = {m}")
+                    elif status == "timeout":
+                        print(f"Operation stopped due to timeout with n = {trial_n}, m = {m}")
+                    if status != "ok":
+                        stopped = True
+                        break
+                    max_n = trial_n  # Update max_n to the last successful n
+                n += workers * increment
+                if stopped:
+                    stop_workers(executor)  # Drop the rest of this round, including a timed-out build
     except KeyboardInterrupt:
         print(f"Keyboard Interrupt: Current values - n = {max_n} , m = {m}")
 
@@ -342,7 +476,6 @@ def main():
         
         execution_time = end_time - start_time
         print(f"Total execution time: {execution_time} seconds")
-        build_and_visualize_graph(n, m)
     else:
         print("Invalid input. Please enter 'test' or 'build'.")
     
@@ -1,6 +1,5 @@
-import networkx as nx
-import matplotlib.pyplot as plt
 import numpy as np
+import sys
 import time 
 import math 
 
@@ -15,8 +14,10 @@ class Graph:
         self.n = n
         # The total number of nodes is n branch nodes + 1 center node + 2n leaf nodes
         self.order = 1 + n + 2 * n
-        self.adj_list = {i: [] for i in range(self.order)}
+        self.adj_list = {}  # Neighbor lists, filled by build_graph or add_edge
         self.edge_labels = {}  # Dictionary to store edge labels
+        self.edge_u = []  # First end of each edge, in insertion order
+        self.edge_v = []  # Second end of each edge, in insertion order
 
     def add_edge(self, u, v, label):
         """
@@ -27,10 +28,38 @@ class Graph:
             v (int): The other end of the edge.
             label (int): The label to be assigned to the edge.
         """
-        self.adj_list[u].append(v)
-        self.adj_list[v].append(u)
+        self.adj_list.setdefault(u, []).append(v)
+        self.adj_list.setdefault(v, []).append(u)
+        if u > v:  # Storing each edge once, with the smaller vertex first
+            u, v = v, u
+        self.edge_u.append(u)  # Recording the edge once in the edge arrays
+        self.edge_v.append(v)
         self.edge_labels[(u, v)] = label  # Storing the edge label
-        self.edge_labels[(v, u)] = label  # Storing the edge label for the opposite direction
+
+    def build_graph(self):
+        """
+        Adds all edges of the modified star graph directly from its known structure.
+
+        Every degree is known in advance (center n, branch 5, leaf 1), so each adjacency
+        list is created at its final size instead of being grown by add_edge appends.
+        """
+        n = self.n
+        # Center: every branch node. Branch i: the center, its leaves n + 2i - 1 and n + 2i,
+        # and the next and previous branch nodes. Leaf v: its branch node (v - n + 1) // 2.
+        self.adj_list = {
+            v: (list(range(1, n + 1)) if v == 0
+                else [0, n + 2 * v - 1, n + 2 * v, v % n + 1, (v - 2) % n + 1] if v <= n
+                else [(v - n + 1) // 2])
+            for v in range(self.order)
+        }
+        for i in range(1, n + 1):
+            leaf1 = n + 2 * (i - 1) + 1
+            leaf2 = n + 2 * (i - 1) + 2
+            # Record each edge from branch node i: to the center, its two leaves and the next branch node
+            next_branch = i % n + 1
+            self.edge_u += [0, i, i, min(i, next_branch)]
+            self.edge_v += [i, leaf1, leaf2, max(i, next_branch)]
+        self.edge_labels = dict.fromkeys(zip(self.edge_u, self.edge_v), 0)
 
 
 def assign_labels(graph):
@@ -46,41 +75,36 @@ def assign_labels(graph):
     Returns:
         tuple: A tuple containing dictionaries of vertex labels and unique edge labels.
     """
-    vertex_labels = {}  # Dictionary to store vertex labels
-    edge_labels = {}  # Dictionary to store edge labels
+    n = graph.n
+    labels = np.empty(graph.order, dtype=np.int64)  # Array to store vertex labels
     # Calculate k based on the number of edges and vertices using the ceiling function
     number_of_edges = 3 * graph.n + graph.n  # Correct formula for the number of edges in the modified star graph
     k = math.ceil(number_of_edges * math.log2(graph.order))  # Use math.ceil to round up
     print("k value (upper bound): ", k)
 
     # Greedy labeling starting from central vertex
-    vertex_labels[0] = 1 # min(graph.n + 1, k)  # Labeling the center vertex
+    labels[0] = 1 # min(graph.n + 1, k)  # Labeling the center vertex
     
-    # Output vertex labels
-    inner_verts = 11
-    for vert in range(1, graph.n + 1):
-        vertex_labels[vert] = min(k, inner_verts)
-        inner_verts += 4
- 
-    for i in range(1, graph.n+1):
-        branch_val = vertex_labels[i]
-        for j in range(1, 4, 2):
-            vert = vert + 1
-            vertex_labels[vert] = min(k, branch_val + j)
+    # Output vertex labels: branch nodes start at 11 and step by 4
+    branch = np.minimum(k, 11 + 4 * np.arange(n))
+    labels[1:n + 1] = branch
+    # Each branch's first leaf is 1 higher and its second leaf is 3 higher
+    labels[n + 1::2] = np.minimum(k, branch + 1)
+    labels[n + 2::2] = np.minimum(k, branch + 3)
             
     # After labeling, find the maximum vertex label
-    max_vertex_label = max(vertex_labels.values())
+    max_vertex_label = labels.max()
     print("Maximum vertex label value: ", max_vertex_label)
 
 
 
-    # Assigning edge labels
-    for vertex, neighbors in graph.adj_list.items():
-        for neighbor in neighbors:
-            edge_label = vertex_labels[vertex] + vertex_labels[neighbor]
-            edge_labels[(vertex, neighbor)] = edge_label
-            edge_labels[(neighbor, vertex)] = edge_label
+    # Assigning edge labels, one entry per edge
+    edge_u = np.asarray(graph.edge_u, dtype=np.int64)
+    edge_v = np.asarray(graph.edge_v, dtype=np.int64)
+    edge_w = labels[edge_u] + labels[edge_v]
 
+    vertex_labels = dict(enumerate(labels.tolist()))
+    edge_labels = dict(zip(zip(graph.edge_u, graph.edge_v), edge_w.tolist()))
     return vertex_labels, edge_labels
 
 def verify_unique_edge_values(edge_labels):
@@ -93,9 +117,9 @@ def verify_unique_edge_values(edge_labels):
     Returns:
         bool: True if all edge values are unique, False otherwise.
     """
-    edge_values = list(edge_labels.values())
-    unique_values = len(edge_values)/2 == len(set(edge_values)) + 1
-    max_edge_value = max(edge_values)
+    edge_values = np.fromiter(edge_labels.values(), np.int64, count=len(edge_labels))
+    unique_values = np.unique(edge_values).size + 1 == edge_values.size
+    max_edge_value = edge_values.max()
     print(f"All edge values are unique: {unique_values}")
     print(f"Maximum edge weight value: {max_edge_value}")
 
@@ -109,15 +133,7 @@ def main():
     graph = Graph(n)
 
     # Adding edges for the modified star graph
-    for i in range(1, n + 1):
-        graph.add_edge(0, i, 0)  # Connect branch nodes to center
-        leaf1 = n + 2 * (i - 1) + 1
-        leaf2 = n + 2 * (i - 1) + 2
-        graph.add_edge(i, leaf1, 0)  # Add leaf nodes
-        graph.add_edge(i, leaf2, 0)
-        # Connect each branch node to the next and previous one
-        next_branch = i % n + 1
-        graph.add_edge(i, next_branch, 0)
+    graph.build_graph()
 
     # Assign labels to vertices and edges
     vertex_labels, edge_labels = assign_labels(graph)
@@ -130,42 +146,34 @@ def main():
     # verifying edge weight uniqueness (for debugging)
     verify_unique_edge_values(edge_labels)
     
-    # printing edge and vertex labels (for debugging)
-    print("Vertex Labels:")
-    for vertex, label in vertex_labels.items():
-        print(f"Vertex {vertex}: Label {label}")
-    print("Edge Labels:")
-    i = 1
-    for edge, label in edge_labels.items():
-        if i == 1:
-            print(f"Edge {edge}: Label {label}")
-            i = 0
-        else:
-            i = 1
+    # printing edge and vertex labels (for debugging), formatting each row with a bound %-format
+    sys.stdout.write("Vertex Labels:\n")
+    sys.stdout.writelines(map("Vertex %d: Label %d\n".__mod__, vertex_labels.items()))
+    sys.stdout.write("Edge Labels:\n")
+    sys.stdout.writelines(map("Edge (%d, %d): Label %d\n".__mod__, ((u, v, w) for (u, v), w in edge_labels.items())))
     
-    # Visualize graph using networkx library
+    # Visualize graph using networkx library (imported here so labeling alone does not load the plotting libraries)
+    import networkx as nx
+    import matplotlib.pyplot as plt
+
     plt.figure(figsize=(12, 12))  # Increase the figure size
     G = nx.Graph()
-    for vertex, neighbors in graph.adj_list.items():
-        for neighbor in neighbors:
-            G.add_edge(vertex, neighbor, label=edge_labels[(vertex, neighbor)])
+    G.add_edges_from(zip(graph.edge_u, graph.edge_v))  # Each edge is stored once, so add them in bulk
     
     # Use a circular layout for the branch nodes
     center_pos = {0: (0, 0)}  # Center node at origin
-    branch_pos = nx.circular_layout(range(1, n + 1), center=(0, 0))  # Circular layout for branch nodes
     
-   # Calculate the circular positions for the branch nodes
+    # Calculate the circular positions for the branch nodes as one (n, 2) array
     radius = 1  # Radius for branch nodes
     branch_angles = np.linspace(0, 2 * np.pi, n, endpoint=False)
-    branch_pos = {i: (radius * np.cos(ang), radius * np.sin(ang)) for i, ang in enumerate(branch_angles, 1)}
+    branch_xy = radius * np.column_stack((np.cos(branch_angles), np.sin(branch_angles)))
+    branch_pos = dict(zip(range(1, n + 1), map(tuple, branch_xy.tolist())))
 
-    # Calculate the positions for the leaf nodes
+    # Calculate the positions for the leaf nodes (n + 1 .. 3n) on an outer circle
     leaf_angles = np.linspace(0, 2 * np.pi, 2*n, endpoint=False)
     radius_leaf = 1.5  # Radius for leaf nodes
-    leaf_pos = {}
-    for i in range(n):
-        leaf_pos[n + 2 * i + 1] = (radius_leaf * np.cos(leaf_angles[2 * i]), radius_leaf * np.sin(leaf_angles[2 * i]))
-        leaf_pos[n + 2 * i + 2] = (radius_leaf * np.cos(leaf_angles[2 * i + 1]), radius_leaf * np.sin(leaf_angles[2 * i + 1]))
+    leaf_xy = radius_leaf * np.column_stack((np.cos(leaf_angles), np.sin(leaf_angles)))
+    leaf_pos = dict(zip(range(n + 1, 3 * n + 1), map(tuple, leaf_xy.tolist())))
 
     # Merge all positions together
     pos = {**center_pos, **branch_pos, **leaf_pos}
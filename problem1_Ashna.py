@@ -1,7 +1,6 @@
 # Importing necessary libraries
-import math
-import networkx as nx
-import matplotlib.pyplot as plt
+import sys
+import numpy as np
  
 # Class definition for a graph
 class Graph:
@@ -20,173 +19,234 @@ class Graph:
         self.k = k
         self.order = order
         # Initializing data structures to represent the graph
-        self.adj_list = {i: [] for i in range(order)}  # Adjacency list representation of the graph
-        self.edge_weights = {}  # Dictionary to store edge weights
-        self.vertex_labels = {i: None for i in range(order)}  # Dictionary to store vertex labels
-    def add_edge(self, u, v, weight):
+        # Compressed sparse row adjacency: the neighbors of u are indices[indptr[u]:indptr[u+1]]
+        # Degrees are known up front: n for the center, m + 1 per inner vertex, 1 per external vertex
+        deg = np.ones(order, dtype=np.int64)
+        deg[0] = n
+        deg[1:n + 1] = m + 1
+        self.indptr = np.concatenate(([0], np.cumsum(deg)))
+        self.indices = np.empty(self.indptr[-1], dtype=np.int64)  # Each edge is stored once per end
+        self.edge_u = np.empty(0, dtype=np.int64)  # Smaller end of each edge
+        self.edge_v = np.empty(0, dtype=np.int64)  # Larger end of each edge
+        self.weights = np.empty(0, dtype=np.int64)  # Edge weights aligned with edge_u/edge_v
+        self.vertex_labels = np.zeros(order, dtype=np.int64)  # Vertex labels indexed by vertex
+    def build_graph(self):
         """
-        Adds an edge between two nodes with a given weight.
+        Fills the CSR adjacency of the star directly from its known structure.
  
-        Args:
-            u (int): One end of the edge.
-            v (int): The other end of the edge.
-            weight (int): The weight to be assigned to the edge.
+        The row offsets are already set from the vertex degrees in __init__, so
+        every block of indices is a closed-form arange and no adjacency lists
+        need to grow.
         """
-        # Adding edge to the adjacency list
-        self.adj_list[u].append(v)
-        self.adj_list[v].append(u)
-        # Storing edge weight in both directions
-        self.edge_weights[(u, v)] = weight
-        self.edge_weights[(v, u)] = weight
+        n, m = self.n, self.m
+        inner_end = self.indptr[n + 1]  # End of the inner vertices' block in indices
+        # Central vertex: connected to every inner vertex
+        self.indices[:n] = np.arange(1, n + 1)
+        # Inner vertices: connected to the central vertex, then to their external vertices
+        inner_block = self.indices[n:inner_end].reshape(n, m + 1)
+        inner_block[:, 0] = 0
+        inner_block[:, 1:] = np.arange(n + 1, self.order).reshape(n, m)
+        # External vertices: connected to their inner vertex
+        self.indices[inner_end:] = np.repeat(np.arange(1, n + 1), m)
+ 
+    def neighbors(self, u):
+        """
+        Returns the neighbors of vertex u as a slice of the CSR indices array.
+        """
+        return self.indices[self.indptr[u]:self.indptr[u + 1]]
  
     def vertex_k_labeling(self):
         """
         Calculates vertex labels for the graph.
+
+        Returns:
+            np.ndarray: The label of every vertex, indexed by vertex.
         """
+        n = self.n
+        c = (n + 3) // 4  # ceil(n / 4) with integer arithmetic
+        labels = np.empty(self.order, dtype=np.int64)
         # Setting label for central vertex
-        self.vertex_labels[0] = 1
+        labels[0] = 1
  
         # Case 1
-        if self.n % 4 == 0 or self.n % 4 == 2 or self.n % 4 == 3:
-            # Labeling internal vertices
-            for i in range(1, self.n + 1):
-                vertex = i
-                if 1 <= i <= math.ceil(self.n / 4) + 1:
-                    self.vertex_labels[vertex] = 3 * i - 2
-                elif math.ceil(self.n / 4) + 2 <= i <= self.n:
-                    self.vertex_labels[vertex] = 2 * math.ceil(self.n / 4) + i
-            # Labeling external vertices
-            vertex += 1
-            for i in range(1, (math.ceil(self.n / 4) + 1)):
-                for j in range(1, 3):  
-                    self.vertex_labels[vertex] =  j + 1
-                    vertex = vertex + 1
-            for i in range((math.ceil(self.n / 4) + 1), self.n + 1):
-                for j in range(1, 3):
-                    self.vertex_labels[vertex] = self.n + i + j - 1 - 2 * math.ceil(self.n / 4)
-                    vertex = vertex + 1
-        # Case 2 
-        elif self.n % 4 == 1:
-            for i in range(1, self.n + 1):
-                vertex = i
-                if 1 <= i <= math.ceil(self.n / 4):
-                    self.vertex_labels[vertex] = 3 * i - 2
-                elif math.ceil(self.n / 4) + 1 <= i <= self.n:
-                    self.vertex_labels[vertex] = 2 * math.ceil(self.n / 4) + i - 1
-            # Labeling external vertices
-            vertex += 1
-            for i in range(1, math.ceil(self.n / 4)):
-                for j in range(1, 3):  
-                    self.vertex_labels[vertex] =  j + 1
-                    vertex = vertex + 1
-            self.vertex_labels[vertex] =  2
-            vertex = vertex + 1     
-            self.vertex_labels[vertex] =  self.n - math.ceil(self.n / 4) + 3   
-            vertex = vertex + 1                 
-            for i in range((math.ceil(self.n / 4) + 1), self.n + 1):
-                for j in range(1, 3):
-                    self.vertex_labels[vertex] = self.n + i + j- 2 * math.ceil(self.n / 4)
-                    vertex = vertex + 1
+        if n % 4 == 0 or n % 4 == 2 or n % 4 == 3:
+            # Labeling internal vertices: 3i - 2 up to ceil(n/4) + 1, then 2*ceil(n/4) + i
+            labels[1:c + 2] = 3 * np.arange(1, c + 2) - 2
+            labels[c + 2:n + 1] = 2 * c + np.arange(c + 2, n + 1)
+            # Labeling external vertices: the pair (2, 3) for each of the first ceil(n/4) branches
+            labels[n + 1:n + 1 + 2 * c] = np.tile([2, 3], c)
+            # then n + i + j - 1 - 2*ceil(n/4) for j = 1, 2 on the remaining branches
+            labels[n + 1 + 2 * c:] = np.add.outer(np.arange(c + 1, n + 1), [0, 1]).ravel() + n - 2 * c
+        # Case 2
+        elif n % 4 == 1:
+            # Labeling internal vertices: 3i - 2 up to ceil(n/4), then 2*ceil(n/4) + i - 1
+            labels[1:c + 1] = 3 * np.arange(1, c + 1) - 2
+            labels[c + 1:n + 1] = 2 * c - 1 + np.arange(c + 1, n + 1)
+            # Labeling external vertices: the pair (2, 3) for each of the first ceil(n/4) - 1 branches
+            labels[n + 1:n - 1 + 2 * c] = np.tile([2, 3], c - 1)
+            labels[n - 1 + 2 * c] = 2
+            labels[n + 2 * c] = n - c + 3
+            # then n + i + j - 2*ceil(n/4) for j = 1, 2 on the remaining branches
+            labels[n + 1 + 2 * c:] = np.add.outer(np.arange(c + 1, n + 1), [0, 1]).ravel() + n - 2 * c + 1
+        self.vertex_labels = labels
         return self.vertex_labels
-    def calculate_edge_weights(self):
-        """
-        Calculates edge weights based on vertex labels and adjacency list.
-        """
-        for vertex, neighbors in self.adj_list.items():
-            for neighbor in neighbors:
-                # Calculate edge weight by summing up the labels of the two vertices
-                print('vertex', vertex)
-                print('neighbor', neighbor)
-                print()
-                weight = self.vertex_labels[vertex] + self.vertex_labels[neighbor]
-                self.edge_weights[(vertex, neighbor)] = weight
-                self.edge_weights[(neighbor, vertex)] = weight
-        return self.edge_weights
+    def calculate_edge_weights(self, debug=False):
+        """
+        Calculates edge weights based on vertex labels and the CSR adjacency.
+ 
+        Args:
+            debug (bool): If True, prints every (vertex, neighbor) pair in a single write.
+
+        Returns:
+            np.ndarray: The weight of every edge, aligned with edge_u and edge_v.
+        """
+        # Vertex that owns each CSR entry, so (u_repeat[i], indices[i]) walks every adjacency
+        u_repeat = np.repeat(np.arange(self.order), np.diff(self.indptr))
+        # Keeping each edge once, with the smaller vertex first
+        half = u_repeat < self.indices
+        self.edge_u = u_repeat[half]
+        self.edge_v = self.indices[half]
+        # Calculate every edge weight at once by summing up the labels of the two vertices
+        self.weights = self.vertex_labels[self.edge_u] + self.vertex_labels[self.edge_v]
+        if debug:
+            print("\n".join(f"vertex {u}\nneighbor {v}\n" for u, v in zip(self.edge_u.tolist(), self.edge_v.tolist())))
+        return self.weights
+    def get_edge_weight(self, u, v):
+        """
+        Returns the weight of the edge between u and v.
+
+        Args:
+            u (int): One end of the edge.
+            v (int): The other end of the edge.
+
+        Returns:
+            int: The weight of the edge.
+
+        Raises:
+            KeyError: If u and v are not adjacent.
+        """
+        u, v = min(u, v), max(u, v)
+        neighbors = self.neighbors(u)  # Sorted, so membership is a binary search
+        i = np.searchsorted(neighbors, v)
+        if i == neighbors.size or neighbors[i] != v:
+            raise KeyError((u, v))
+        # The star is a tree rooted at 0, so the edge reaching v from its parent is edge v - 1
+        return int(self.weights[v - 1])
     def get_adj_list(self):
         """
-        Returns the adjacency list of the graph.
+        Returns the adjacency list of the graph, rebuilt from the CSR arrays.
         """
-        return self.adj_list
+        indptr = self.indptr.tolist()
+        indices = self.indices.tolist()
+        return {u: indices[indptr[u]:indptr[u + 1]] for u in range(self.order)}
+ 
+    def get_layout(self):
+        """
+        Computes drawing positions analytically instead of with a force-directed layout.
+ 
+        The central vertex sits at the origin, the inner vertices are spread on a circle
+        of radius 1 and each inner vertex's external vertices fan out around the same
+        angle on a circle of radius 2.
+ 
+        Returns:
+            np.ndarray: An (order, 2) array of x, y positions indexed by vertex.
+        """
+        n, m = self.n, self.m
+        pos = np.zeros((self.order, 2))
+        inner_angles = 2 * np.pi * np.arange(n) / n
+        pos[1:n + 1] = np.column_stack((np.cos(inner_angles), np.sin(inner_angles)))
+        outer_angles = 2 * np.pi * (np.arange(n * m) - (m - 1) / 2) / (n * m)
+        pos[n + 1:] = 2 * np.column_stack((np.cos(outer_angles), np.sin(outer_angles)))
+        return pos
  
     def verify_unique_edge_values(self, edge_labels):
         """
         Verifies if all edge values are unique and prints the maximum edge weight.
  
         Args:
-            edge_labels (dict): A dictionary of edge labels.
+            edge_labels (np.ndarray): The weight of every edge.
  
         Returns:
             bool: True if all edge values are unique, False otherwise.
         """
-        edge_values = list(self.edge_weights.values())
-        unique_values = len(edge_values)/2 == len(set(edge_values)) 
-        max_edge_value = max(edge_values)
+        edge_values = edge_labels  # One weight per edge
+        unique_values = np.unique(edge_values).size == edge_values.size
+        max_edge_value = edge_values.max()
         print(f"All edge values are unique: {unique_values}")
         print(f"Maximum edge weight value: {max_edge_value}")
+def visualize_graph(graph):
+    """
+    Draws the labeled graph directly with matplotlib from the edge arrays and the analytical layout.
+
+    matplotlib is imported here so that labeling alone does not pay for it.
+
+    Args:
+        graph (Graph): A graph whose vertex labels and edge weights have been calculated.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
+
+    pos = graph.get_layout()  # positions for all nodes
+    fig, ax = plt.subplots()
+    segments = np.stack((pos[graph.edge_u], pos[graph.edge_v]), axis=1)  # One (2, 2) segment per edge
+    ax.add_collection(LineCollection(segments, colors='black', zorder=1))
+    ax.scatter(pos[:, 0], pos[:, 1], s=1500, c='skyblue', zorder=2)
+
+    # Adding node labels
+    for node, label in enumerate(graph.vertex_labels.tolist()):
+        ax.annotate(str(label), pos[node], ha='center', va='center', fontsize=10, color='black', zorder=3)
+    # Drawing edge labels at the middle of each edge
+    for (x, y), weight in zip(segments.mean(axis=1).tolist(), graph.weights.tolist()):
+        ax.text(x, y, str(weight), ha='center', va='center', color='red', zorder=3,
+                bbox=dict(boxstyle='round', ec='white', fc='white'))
+    ax.set_aspect('equal')
+    ax.axis('off')
+
+    # Displaying the graph
+    plt.show()
 # Main function
-def main():
+def main(n=9, visualize=False, verify=False):
+    """
+    Labels S(n, 3) and prints the vertex labels, adjacency list and edge weights.
+
+    Args:
+        n (int): The number of inner vertices.
+        visualize (bool): If True, draws the labeled graph.
+        verify (bool): If True, checks that all edge weights are distinct.
+    """
     # Graph parameters
-    n = 9
     m = 2
     order = m * n + n + 1
-    k = math.ceil((m * n + n + 1) / 2)
+    k = (order + 1) // 2  # ceil(order / 2) with integer arithmetic, stored once on the graph
     # Creating graph object
     graph = Graph(n, m, k, order)
  
-    outer_verts = n
- 
     # Adding edges for the star graph
-    for i in range(1, n + 1):
-        graph.add_edge(0, i, 0)  # Connect central vertex to inner vertices
-        for j in range(1, (m+1)):
-            outer_verts += 1
-            graph.add_edge(i, outer_verts, 0) # Connect inner vertices to their external vertices
+    graph.build_graph()
     # Calculating vertex labels, adjacency list, and edge weights
     vertex_labels = graph.vertex_k_labeling()
     adj_list = graph.get_adj_list()
     edge_weights = graph.calculate_edge_weights()
  
-    # Printing vertex labels
-    print("===== Vertex Labels =====")
-    for vertex, label in vertex_labels.items():
-        print(f"Vertex: {vertex}, Label: {label}")
-    # Printing adjacency list
-    print("===== Adjacency List =====")
-    for vertex, neighbors in adj_list.items():
-        # Convert the list of neighbors to a string for printing
-        neighbors_str = ', '.join(map(str, neighbors))
-        # Print the vertex and its neighbors
-        print(f"Vertex: {vertex}, neighbors: [{neighbors_str}]")
+    # Printing vertex labels, formatting each row with a bound %-format
+    sys.stdout.write("===== Vertex Labels =====\n")
+    sys.stdout.writelines(map("Vertex: %d, Label: %d\n".__mod__, enumerate(vertex_labels.tolist())))
+    # Printing adjacency list, with each list of neighbors joined into a string
+    sys.stdout.write("===== Adjacency List =====\n"
+                     + "".join(f"Vertex: {vertex}, neighbors: [{', '.join(map(str, neighbors))}]\n"
+                               for vertex, neighbors in adj_list.items()))
     # Printing edge weights
-    print("===== Edge Weights =====")
-    for edge, weight in edge_weights.items():
-        print(f"Edge: {edge}, Weight: {weight}")
-    graph.verify_unique_edge_values(edge_weights)
-    # Creating a NetworkX graph
-    G = nx.Graph()
-    G.add_nodes_from(range(order))
-    # Adding edges from adjacency list
-    for vertex, neighbors in adj_list.items():
-        for neighbor in neighbors:
-            G.add_edge(vertex, neighbor)
- 
-    pos = nx.spring_layout(G)  # positions for all nodes
- 
-    # Adding node labels
-    labels = {node: str(label) for node, label in vertex_labels.items()}
-    nx.draw_networkx_labels(G, pos, labels=labels, font_size=10, font_color='black')
- 
-    # Drawing the graph
-    nx.draw(G, pos, with_labels=False, node_color='skyblue', node_size=1500)
-    # Drawing edge labels
-    nx.draw_networkx_edge_labels(G, pos, edge_labels=edge_weights, font_color='red')
- 
-    # Displaying the graph
-    plt.show()
+    sys.stdout.write("===== Edge Weights =====\n")
+    sys.stdout.writelines(map("Edge: (%d, %d), Weight: %d\n".__mod__,
+                              zip(graph.edge_u.tolist(), graph.edge_v.tolist(), edge_weights.tolist())))
+    if verify:
+        graph.verify_unique_edge_values(edge_weights)
+    if visualize:
+        visualize_graph(graph)
  
  
 # Entry point of the program
 if __name__ == "__main__":
-    main()
+    main(visualize=True, verify=True)
     
 